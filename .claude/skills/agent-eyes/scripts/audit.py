@@ -0,0 +1,300 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["playwright"]
+# ///
+"""Accessibility audit of one page or a whole site with axe-core.
+
+Usage:
+    uv run scripts/audit.py https://example.com
+    uv run scripts/audit.py https://example.com --crawl --max-pages 500 --workers 8
+    uv run scripts/audit.py https://example.com --standards wcag2a wcag2aa -o a11y.md
+
+``--crawl`` follows same-origin links from the start URL and audits pages
+concurrently with a bounded pool of tabs in one shared browser, then merges
+every page into one site report. Identical violations (same rule ID and
+selector) are listed once with the pages they were found on.
+
+Results are cached per page under ``~/.cache/agent-eyes/<host>.json``, keyed
+by a hash of the normalized DOM plus the axe build and standards. Pages whose
+DOM has not changed are still loaded (to find links) but axe is not re-run.
+Each run reports new, fixed and still-open violations against the previous
+one; ``--diff`` writes that comparison as markdown.
+
+First run: ``uv run playwright install chromium``.
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+import urllib.request
+from datetime import datetime
+from urllib.parse import urldefrag, urlsplit
+
+from cache import AuditCache, axe_id, content_key, default_path
+from report import diff, render, render_diff, selector
+
+AXE_VERSION = "4.8.4"
+AXE_URL = f"https://cdn.jsdelivr.net/npm/axe-core@{AXE_VERSION}/axe.min.js"
+AXE_CACHE = os.path.expanduser(f"~/.cache/agent-eyes/axe-{AXE_VERSION}.min.js")
+DEFAULT_STANDARDS = ["wcag2aa", "best-practice"]
+SKIP_EXTENSIONS = (
+    ".pdf", ".zip", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico",
+    ".mp3", ".mp4", ".webm", ".css", ".js", ".json", ".xml", ".txt",
+)
+AXE_RESULT_KEYS = ("id", "impact", "help", "description", "helpUrl")
+
+
+def load_axe(path=None):
+    """Return axe-core's source, downloading it once into the user cache."""
+    if path:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    if not os.path.exists(AXE_CACHE):
+        os.makedirs(os.path.dirname(AXE_CACHE), exist_ok=True)
+        with urllib.request.urlopen(AXE_URL, timeout=30) as resp:
+            data = resp.read()
+        with open(AXE_CACHE, "wb") as f:
+            f.write(data)
+    with open(AXE_CACHE, encoding="utf-8") as f:
+        return f.read()
+
+
+def _slim(rules):
+    return [
+        {**{k: r.get(k) for k in AXE_RESULT_KEYS},
+         "nodes": [{"target": n.get("target"), "html": n.get("html", "")} for n in r["nodes"]]}
+        for r in rules
+    ]
+
+
+async def audit_page(page, url, axe_source, standards, timeout_ms, cache=None, axe_fp=None,
+                     use_cached=True):
+    """Load ``url`` in ``page``, run axe and return ``(result, links)``.
+
+    With a ``cache``, axe is skipped when the page's normalized DOM matches
+    the cached entry. ``use_cached=False`` always runs axe but still updates
+    the cache.
+    """
+    await page.goto(url, wait_until="load", timeout=timeout_ms)
+    links = await page.eval_on_selector_all("a[href]", "els => els.map(e => e.href)")
+    if cache is not None:
+        key = content_key(await page.content(), standards, axe_fp)
+        cached = cache.get(url, key) if use_cached else None
+        if cached is not None:
+            return cached, links
+    await page.add_script_tag(content=axe_source)
+    raw = await page.evaluate(
+        "standards => axe.run(document, {runOnly: {type: 'tag', values: standards}})",
+        standards,
+    )
+    result = {
+        "url": url,
+        "violations": _slim(raw["violations"]),
+        "incomplete": _slim(raw["incomplete"]),
+        # Reports only list passing rules, so their nodes are not kept.
+        "passes": [{k: rule.get(k) for k in AXE_RESULT_KEYS} for rule in raw["passes"]],
+    }
+    if cache is not None:
+        cache.put(url, key, result)
+    return result, links
+
+
+def same_site_links(links, origin):
+    """Normalize ``links`` and keep only crawlable same-origin pages."""
+    for link in links:
+        link, _ = urldefrag(link)
+        parts = urlsplit(link)
+        if parts.scheme not in ("http", "https") or f"{parts.scheme}://{parts.netloc}" != origin:
+            continue
+        if parts.path.lower().endswith(SKIP_EXTENSIONS):
+            continue
+        yield link
+
+
+def merge(results):
+    """Merge per-page results into one site-level result.
+
+    Violations and needs-review items are de-duplicated by rule ID + selector;
+    each node lists the pages it was found on. A rule is listed as passing if
+    it passed on any page, as axe does for a single page.
+    """
+    def combine(key):
+        rules = {}
+        for res in results:
+            for rule in res[key]:
+                merged = rules.setdefault(rule["id"], {**rule, "nodes": [], "_seen": {}})
+                for node in rule["nodes"]:
+                    sel = selector(node)
+                    seen = merged["_seen"].get(sel)
+                    if seen is None:
+                        seen = merged["_seen"][sel] = {**node, "pages": []}
+                        merged["nodes"].append(seen)
+                    if res["url"] not in seen["pages"]:
+                        seen["pages"].append(res["url"])
+        for rule in rules.values():
+            del rule["_seen"]
+        return list(rules.values())
+
+    passes = {}
+    for res in results:
+        for rule in res["passes"]:
+            passes.setdefault(rule["id"], {k: rule.get(k) for k in AXE_RESULT_KEYS})
+    return {
+        "pages": [res["url"] for res in results],
+        "violations": combine("violations"),
+        "incomplete": combine("incomplete"),
+        "passes": list(passes.values()),
+    }
+
+
+async def crawl(start_url, axe_source, standards=DEFAULT_STANDARDS, max_pages=100,
+                workers=4, timeout_ms=30000, follow=True, cache=None, use_cached=True):
+    """Audit ``start_url`` and, if ``follow``, every same-origin page it links to.
+
+    Returns ``(results, errors)`` where ``errors`` maps URL to message. Up to
+    ``workers`` tabs of one headless Chromium audit pages concurrently. Pages
+    are discovered breadth-first, one link depth at a time and sorted by URL,
+    so ``max_pages`` picks the same pages on every run.
+    Pages found unchanged in ``cache`` reuse their cached result unless
+    ``use_cached`` is false.
+    """
+    from playwright.async_api import async_playwright
+
+    parts = urlsplit(start_url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+    start_url, _ = urldefrag(start_url)
+    queue = asyncio.Queue()
+    seen = {start_url: 0}  # URL -> discovery order (depth, then URL)
+    found = set()  # same-origin links found at the current depth
+    aliases = set()  # the start URL after redirects
+    axe_fp = axe_id(axe_source)
+    results, errors = [], {}
+
+    async def worker(page):
+        nonlocal origin
+        while True:
+            url = await queue.get()
+            try:
+                result, links = await audit_page(page, url, axe_source, standards,
+                                                 timeout_ms, cache, axe_fp, use_cached)
+                results.append(result)
+                if url == start_url:
+                    # Follow redirects such as http -> https or apex -> www.
+                    final = urlsplit(page.url)
+                    origin = f"{final.scheme}://{final.netloc}"
+                    aliases.add(urldefrag(page.url)[0])
+                if follow:
+                    found.update(same_site_links(links, origin))
+            except Exception as exc:  # one bad page must not stop the crawl
+                errors[url] = (str(exc) or type(exc).__name__).splitlines()[0]
+            finally:
+                queue.task_done()
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        try:
+            context = await browser.new_context()
+            # Open every tab before any worker starts, so a failure here raises
+            # instead of leaving queue.join() waiting on workers that died.
+            pages = [await context.new_page() for _ in range(max(1, workers))]
+            tasks = [asyncio.create_task(worker(page)) for page in pages]
+            level = [start_url]
+            while level:
+                found.clear()
+                for url in level:
+                    queue.put_nowait(url)
+                await queue.join()
+                level = sorted(found - seen.keys() - aliases)[:max(0, max_pages - len(seen))]
+                for url in level:
+                    seen[url] = len(seen)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            await browser.close()
+
+    results.sort(key=lambda r: seen[r["url"]])
+    return results, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url")
+    parser.add_argument("--crawl", action="store_true", help="audit every same-origin page")
+    parser.add_argument("--max-pages", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=4, help="concurrent tabs (default: 4)")
+    parser.add_argument("--standards", nargs="+", default=DEFAULT_STANDARDS,
+                        help="axe tags to run (default: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=30, help="page load timeout in seconds")
+    parser.add_argument("--axe", help="path to a local axe.min.js instead of the CDN copy")
+    parser.add_argument("-o", "--output", help="write the markdown report here")
+    parser.add_argument("--cache", help="page cache file (default: ~/.cache/agent-eyes/<host>.json)")
+    parser.add_argument("--no-cache", action="store_true", help="re-audit every page")
+    parser.add_argument("--diff", help="write new/fixed/still-open violations here")
+    args = parser.parse_args(argv)
+
+    try:
+        axe_source = load_axe(args.axe)
+    except OSError as exc:
+        print(f"error: could not load axe-core ({exc}); download {AXE_URL} "
+              "and pass it with --axe", file=sys.stderr)
+        return 2
+
+    cache = AuditCache(args.cache or default_path(args.url))
+    start = time.perf_counter()
+    results, errors = asyncio.run(crawl(
+        args.url, axe_source, args.standards,
+        max_pages=args.max_pages if args.crawl else 1,
+        workers=args.workers if args.crawl else 1,
+        timeout_ms=args.timeout * 1000,
+        follow=args.crawl,
+        cache=cache,
+        use_cached=not args.no_cache,
+    ))
+    elapsed = time.perf_counter() - start
+    for url, message in errors.items():
+        print(f"warning: {url}: {message}", file=sys.stderr)
+    if not results:
+        print(f"error: no pages could be audited from {args.url}", file=sys.stderr)
+        return 2
+
+    audit = merge(results)
+    info = {"url": args.url, "date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "standards": args.standards}
+    audit.update(info)
+    markdown = render(audit)
+    run = f"{'crawl' if args.crawl else 'page'} {args.url}"
+    previous = cache.baselines.get(run)
+    changes = diff(previous, audit, unaudited=errors)
+    # Pages that failed to load keep their last known result in the baseline
+    # and the cache, so a flaky run neither reports false fixes nor forgets them.
+    stale = [cache.pages[url]["result"] for url in errors if url in cache.pages]
+    baseline = {**merge(results + stale), **info} if stale else audit
+    try:
+        # Only a crawl sees the whole site; a single-page run keeps other pages.
+        keep = audit["pages"] + list(errors) if args.crawl else None
+        cache.save(run, baseline, keep_urls=keep)
+    except OSError as exc:
+        print(f"warning: could not write cache {cache.path}: {exc}", file=sys.stderr)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(markdown)
+        print(f"Wrote {args.output}: {len(results)} page(s), {len(audit['violations'])} "
+              f"violation rule(s), {len(results) / elapsed:.1f} pages/s", file=sys.stderr)
+    else:
+        print(markdown)
+    print(f"{cache.hits}/{len(results)} page(s) unchanged since last audit; "
+          f"{len(changes['new'])} new, {len(changes['fixed'])} fixed, "
+          f"{len(changes['open'])} still open, {len(changes['unaudited'])} not audited",
+          file=sys.stderr)
+    if args.diff:
+        with open(args.diff, "w", encoding="utf-8") as f:
+            f.write(render_diff(previous, audit, changes))
+    return 1 if audit["violations"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["playwright"]
+# ///
+"""Crawl-mode throughput against a generated static site on localhost.
+
+Builds N linked pages that share a low-contrast footer (so every page reports
+the same ``color-contrast`` violation), serves them with ``http.server`` on a
+free port, crawls with several worker counts and checks the merged report
+de-duplicates the shared violation.
+
+Usage:
+    uv run scripts/bench_crawl.py --pages 200 --workers 1 4 8
+"""
+
+import argparse
+import asyncio
+import functools
+import http.server
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from audit import crawl, load_axe, merge
+
+PAGE = """<!doctype html>
+<html lang="en">
+<head><meta charset="utf-8"><title>Page {i}</title></head>
+<body>
+<header><nav>{links}</nav></header>
+<main><h1>Page {i}</h1><p>Fixture page {i} of {n}.</p></main>
+<footer><span style="color:#bbb;background:#fff">(FIXTURE LLC)</span></footer>
+</body>
+</html>
+"""
+
+
+def _href(i):
+    return "/" if i == 0 else f"/page-{i}.html"
+
+
+def make_site(root, n, fanout=5):
+    for i in range(n):
+        targets = sorted({(i + k) % n for k in range(1, fanout + 1)} | {(i * 7) % n})
+        links = " ".join(f'<a href="{_href(t)}">Page {t}</a>' for t in targets)
+        name = "index.html" if i == 0 else f"page-{i}.html"
+        with open(os.path.join(root, name), "w", encoding="utf-8") as f:
+            f.write(PAGE.format(i=i, n=n, links=links))
+
+
+class QuietHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def serve(root):
+    handler = functools.partial(QuietHandler, directory=root)
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--axe", help="path to a local axe.min.js")
+    args = parser.parse_args()
+
+    axe_source = load_axe(args.axe)
+    root = tempfile.mkdtemp(prefix="agent-eyes-bench-")
+    server = serve(root)
+    try:
+        make_site(root, args.pages)
+        url = f"http://127.0.0.1:{server.server_address[1]}/"
+        for workers in args.workers:
+            start = time.perf_counter()
+            results, errors = asyncio.run(crawl(url, axe_source, max_pages=args.pages,
+                                                workers=workers))
+            elapsed = time.perf_counter() - start
+            audit = merge(results)
+            contrast = [r for r in audit["violations"] if r["id"] == "color-contrast"]
+            assert not errors, errors
+            assert contrast and len(contrast[0]["nodes"]) == 1, "shared violation not merged"
+            print(f"workers={workers:2d}: {len(results)} pages in {elapsed:6.2f} s "
+                  f"= {len(results) / elapsed:6.1f} pages/s "
+                  f"(color-contrast on {len(contrast[0]['nodes'][0]['pages'])} pages, 1 entry)")
+    finally:
+        server.shutdown()
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Persistent per-page audit cache keyed by normalized DOM hash.
+
+A page is re-audited only when its rendered DOM (after normalization) or the
+audit settings (axe version and standards) change. The cache also keeps the
+last merged audit so the next run can report new, fixed and still-open
+violations.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+from urllib.parse import urlsplit
+
+CACHE_VERSION = 1
+CACHE_DIR = os.path.expanduser("~/.cache/agent-eyes")
+
+# Markup that changes on every load without changing what axe checks.
+VOLATILE_RES = [
+    re.compile(r"<!--.*?-->", re.S),
+    re.compile(r'\s(?:nonce|data-reactid|data-csrf[\w-]*)="[^"]*"'),
+    re.compile(r'(<meta[^>]+name="csrf[^"]*"[^>]+content=")[^"]*"'),
+    re.compile(r'(<input[^>]+name="(?:csrf|_token|authenticity_token)[^"]*"[^>]+value=")[^"]*"'),
+]
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def default_path(url):
+    """Return the default cache file for the site ``url`` belongs to."""
+    host = urlsplit(url).netloc.replace(":", "_") or "local"
+    return os.path.join(CACHE_DIR, f"{host}.json")
+
+
+def normalize_html(html):
+    """Strip comments, nonces, CSRF tokens and whitespace runs from ``html``."""
+    for regex in VOLATILE_RES:
+        html = regex.sub(lambda m: m.group(1) + '"' if m.groups() else "", html)
+    return WHITESPACE_RE.sub(" ", html).strip()
+
+
+def axe_id(axe_source):
+    """Return a short fingerprint of the axe-core source."""
+    return hashlib.sha256(axe_source.encode("utf-8")).hexdigest()[:16]
+
+
+def content_key(html, standards, axe_fingerprint):
+    """Return the cache key for a page's DOM under the given audit settings.
+
+    ``axe_fingerprint`` comes from ``axe_id``, so upgrading axe invalidates
+    every page.
+    """
+    h = hashlib.sha256()
+    h.update(f"{axe_fingerprint}\0{','.join(sorted(standards))}\0".encode())
+    h.update(normalize_html(html).encode("utf-8"))
+    return h.hexdigest()
+
+
+class AuditCache:
+    """JSON file of per-page results plus the last merged audit of each run.
+
+    ``pages`` maps page URL to ``{"key", "result"}``; ``baselines`` maps a
+    run name (e.g. ``"crawl https://example.com"``) to its last merged audit.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.pages = {}
+        self.baselines = {}
+        self.hits = 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION:
+            self.pages = data.get("pages", {})
+            self.baselines = data.get("baselines", {})
+            for entry in self.pages.values():  # older runs stored passing nodes
+                for rule in entry["result"].get("passes", []):
+                    rule.pop("nodes", None)
+
+    def get(self, url, key):
+        """Return the cached result if ``url`` was audited with ``key``, else None."""
+        entry = self.pages.get(url)
+        if entry is None or entry["key"] != key:
+            return None
+        self.hits += 1
+        return entry["result"]
+
+    def put(self, url, key, result):
+        self.pages[url] = {"key": key, "result": result}
+
+    def save(self, run, audit, keep_urls=None):
+        """Write the cache with ``audit`` as the new baseline for ``run``.
+
+        Pages not in ``keep_urls`` (when given) are dropped, so pages that
+        disappeared from the site do not linger.
+        """
+        if keep_urls is not None:
+            keep = set(keep_urls)
+            self.pages = {u: e for u, e in self.pages.items() if u in keep}
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.baselines[run] = audit
+        payload = {"version": CACHE_VERSION, "pages": self.pages, "baselines": self.baselines}
+        fd, tmp = tempfile.mkstemp(prefix=".agent-eyes",
+                                   dir=os.path.dirname(os.path.abspath(self.path)))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"), ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
@@ -0,0 +1,193 @@
+"""Render axe-core results as the agent-eyes markdown report.
+
+``render`` takes an audit dict::
+
+    {
+        "url": "https://example.com",
+        "date": "2026-01-18 14:54:35",
+        "standards": ["wcag2aa", "best-practice"],
+        "pages": ["https://example.com", ...],   # site audits only
+        "violations": [axe result, ...],
+        "incomplete": [axe result, ...],
+        "passes": [axe result, ...],
+    }
+
+where each axe result keeps axe's ``id``, ``impact``, ``help``,
+``description``, ``helpUrl`` and ``nodes`` (``target``, ``html`` and, for
+site audits, ``pages``). A single-page audit renders exactly like
+a11y-agentic-ventures-com.md.
+"""
+
+from collections import Counter
+from urllib.parse import urlsplit
+
+SEVERITIES = [
+    ("critical", "🔴", "Critical"),
+    ("serious", "🟠", "Serious"),
+    ("moderate", "🟡", "Moderate"),
+    ("minor", "🔵", "Minor"),
+]
+SEVERITY_ICON = {key: icon for key, icon, _ in SEVERITIES}
+SEVERITY_LABEL = {key: label for key, _, label in SEVERITIES}
+FOOTER = "*Report generated by agent-eyes using [axe-core](https://github.com/dequelabs/axe-core)*"
+
+
+def selector(node):
+    """Return the CSS selector axe reports for a node as one string."""
+    target = node.get("target") or []
+    return " ".join(t if isinstance(t, str) else " ".join(t) for t in target)
+
+
+def _title(url):
+    host = urlsplit(url).netloc or url
+    return host[4:] if host.startswith("www.") else host
+
+
+def _rule_section(lines, number, rule, show_pages):
+    impact = rule.get("impact") or "minor"
+    lines += [
+        f"### {number}. {SEVERITY_ICON.get(impact, '')} {rule['help']}",
+        "",
+        f"**Impact:** {SEVERITY_LABEL.get(impact, impact.title())}",
+        f"**Rule ID:** `{rule['id']}`",
+        "",
+        rule["description"],
+        "",
+        f"**Affected Elements:** ({len(rule['nodes'])} found)",
+        "",
+    ]
+    for i, node in enumerate(rule["nodes"], 1):
+        lines += [
+            f"{i}. `{selector(node)}`",
+            "   ```html",
+            f"   {node.get('html', '')}",
+            "   ```",
+        ]
+        if show_pages and node.get("pages"):
+            pages = node["pages"]
+            shown = ", ".join(pages[:5]) + (f" (+{len(pages) - 5} more)" if len(pages) > 5 else "")
+            lines.append(f"   Found on {len(pages)} page(s): {shown}")
+    lines += ["", f"**Learn more:** [{rule['id']}]({rule['helpUrl']})", ""]
+
+
+def render(audit):
+    """Return the markdown report for an audit dict."""
+    violations = audit["violations"]
+    incomplete = audit.get("incomplete", [])
+    passes = audit.get("passes", [])
+    pages = audit.get("pages")
+    site = bool(pages) and len(pages) > 1
+
+    lines = [
+        f"# Accessibility Audit: {_title(audit['url'])}",
+        "",
+        f"**URL:** {audit['url']}",
+    ]
+    if site:
+        lines.append(f"**Pages audited:** {len(pages)}")
+    lines += [
+        f"**Date:** {audit['date']}",
+        f"**Standards:** {', '.join(audit['standards'])}",
+        "",
+        "## Summary",
+        "",
+        "| Category | Count |",
+        "|----------|-------|",
+        f"| 🔴 Violations | {len(violations)} |",
+        f"| ⚠️ Needs Review | {len(incomplete)} |",
+        f"| ✅ Passed | {len(passes)} |",
+        "",
+    ]
+
+    if violations:
+        counts = Counter(rule.get("impact") or "minor" for rule in violations)
+        lines += ["### Severity Breakdown", "", "| Severity | Count |", "|----------|-------|"]
+        for key, icon, label in SEVERITIES:
+            if counts.get(key):
+                lines.append(f"| {icon} {label} | {counts[key]} |")
+        lines += ["", "## Violations", ""]
+        for number, rule in enumerate(violations, 1):
+            _rule_section(lines, number, rule, site)
+
+    if incomplete:
+        lines += ["## Needs Review", ""]
+        for number, rule in enumerate(incomplete, 1):
+            _rule_section(lines, number, rule, site)
+
+    if passes:
+        lines += [
+            "## Passing Rules",
+            "",
+            "<details>",
+            f"<summary>{len(passes)} rules passed</summary>",
+            "",
+        ]
+        lines += [f"- ✅ {rule['help']}" for rule in passes]
+        lines += ["", "</details>", ""]
+
+    lines += ["---", "", FOOTER]
+    return "\n".join(lines)
+
+
+def _violation_keys(audit):
+    keys = {}
+    for rule in (audit or {}).get("violations", []):
+        for node in rule["nodes"]:
+            keys[rule["id"], selector(node)] = (rule, node)
+    return keys
+
+
+def diff(previous, current, unaudited=()):
+    """Compare two audits by rule ID + selector.
+
+    Returns ``{"new", "fixed", "open", "unaudited"}`` lists where each item is
+    a ``(rule, node)`` pair taken from the audit it is present in. Previous
+    violations found on a page in ``unaudited`` (pages that failed to load
+    this run) are listed as not audited instead of fixed.
+    """
+    old, new = _violation_keys(previous), _violation_keys(current)
+    unaudited = set(unaudited)
+    gone = [old[k] for k in old if k not in new]
+    return {
+        "new": [new[k] for k in new if k not in old],
+        "fixed": [(r, n) for r, n in gone if not unaudited.intersection(_pages(previous, n))],
+        "open": [new[k] for k in new if k in old],
+        "unaudited": [(r, n) for r, n in gone if unaudited.intersection(_pages(previous, n))],
+    }
+
+
+def _pages(audit, node):
+    return node.get("pages") or audit.get("pages", [])
+
+
+def render_diff(previous, current, changes):
+    """Return a markdown summary of ``changes`` from ``diff``."""
+    lines = [
+        f"# Accessibility Audit Changes: {_title(current['url'])}",
+        "",
+        f"**URL:** {current['url']}",
+        f"**Previous:** {previous['date'] if previous else 'none'}",
+        f"**Current:** {current['date']}",
+        f"**Standards:** {', '.join(current['standards'])}",
+        "",
+        "## Summary",
+        "",
+        "| Change | Count |",
+        "|----------|-------|",
+        f"| 🆕 New | {len(changes['new'])} |",
+        f"| ✅ Fixed | {len(changes['fixed'])} |",
+        f"| 🔁 Still Open | {len(changes['open'])} |",
+        f"| ⏸️ Not Audited | {len(changes['unaudited'])} |",
+        "",
+    ]
+    for key, heading in (("new", "New Violations"), ("fixed", "Fixed"),
+                         ("open", "Still Open"), ("unaudited", "Not Audited This Run")):
+        if not changes[key]:
+            continue
+        lines += [f"## {heading}", ""]
+        for rule, node in changes[key]:
+            icon = SEVERITY_ICON.get(rule.get("impact") or "minor", "")
+            lines.append(f"- {icon} `{rule['id']}` `{selector(node)}`: {rule['help']}")
+        lines.append("")
+    lines += ["---", "", FOOTER]
+    return "\n".join(lines)
@@ -0,0 +1,68 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["pdfplumber"]
+# ///
+"""First-load vs cached-load latency for a PDF, whole document and single page.
+
+Uses temporary cache directories so each first load is cold.
+
+Usage:
+    uv run scripts/bench_convert.py                         # the workshop handout
+    uv run scripts/bench_convert.py path/to/file.pdf --page 10
+"""
+
+import argparse
+import io
+import os
+import shutil
+import tempfile
+import time
+
+import convert
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HANDOUT = os.path.normpath(os.path.join(
+    HERE, "..", "..", "..", "..", "handout-mastering-agent-skills-2026-01-18.pdf"))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("pdf", nargs="?", default=HANDOUT)
+    parser.add_argument("--page", type=int, default=5, help="page for the single-page fetch")
+    args = parser.parse_args()
+
+    def page():
+        with convert.Document(args.pdf) as doc:
+            doc.page(args.page)
+
+    def whole():
+        convert.convert_file(args.pdf, io.StringIO())
+
+    tmp = tempfile.mkdtemp(prefix="convert-bench-")
+    try:
+        convert.CACHE_DIR = os.path.join(tmp, "page")
+        convert.HASH_INDEX = os.path.join(convert.CACHE_DIR, "hashes.json")
+        cold_page, warm_page = timed(page), timed(page)
+        convert.CACHE_DIR = os.path.join(tmp, "doc")
+        convert.HASH_INDEX = os.path.join(convert.CACHE_DIR, "hashes.json")
+        cold_doc, warm_doc = timed(whole), timed(whole)
+        with convert.Document(args.pdf) as doc:
+            pages = doc.page_count
+    finally:
+        shutil.rmtree(tmp)
+
+    print(f"{os.path.basename(args.pdf)}: {pages} pages")
+    print(f"  page {args.page}, first load:   {cold_page:8.1f} ms")
+    print(f"  page {args.page}, cached:       {warm_page:8.1f} ms")
+    print(f"  whole document, first load: {cold_doc:8.1f} ms")
+    print(f"  whole document, cached:     {warm_doc:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
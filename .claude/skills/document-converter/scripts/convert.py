@@ -0,0 +1,267 @@
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["pdfplumber"]
+# ///
+"""Convert PDFs to markdown page by page, with a per-page cache.
+
+Usage:
+    uv run scripts/convert.py handout.pdf                    # whole document
+    uv run scripts/convert.py handout.pdf --pages 3-5        # only these pages
+    uv run scripts/convert.py handout.pdf --grep "progressive disclosure"
+    uv run scripts/convert.py pdfs/ --out-dir references/    # every PDF, in parallel
+
+The PDF is memory-mapped and pages are extracted lazily, one at a time. Each
+page's text and tables are cached under ``~/.cache/document-converter/<hash>-v<N>/``
+(keyed by the file's SHA-256 and the extraction version), so later requests for any page are served
+without opening the PDF at all. Hashes are remembered by path, mtime and size
+so unchanged files are not re-hashed either.
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+CACHE_DIR = os.path.expanduser("~/.cache/document-converter")
+HASH_INDEX = os.path.join(CACHE_DIR, "hashes.json")
+CACHE_VERSION = 3  # bump when extraction output changes, to re-extract cached pages
+
+# Glyphs pdfminer could not map to Unicode come out as "(cid:N)". CID numbers
+# depend on the font, so they are only mapped for fonts listed here (by name
+# without the "ABCDEF+" subset prefix); any other CID is left as is.
+CID_CHARS = {
+    "Geist-Regular": {45: "-"},  # the workshop handout
+}
+_CID = re.compile(r"\(cid:(\d+)\)")
+
+
+def _fix_cids(page):
+    """Replace known unmapped CIDs in ``page.chars`` in place, before extraction."""
+    for char in page.chars:
+        match = _CID.fullmatch(char["text"])
+        if match:
+            font = char.get("fontname", "").partition("+")[2] or char.get("fontname", "")
+            text = CID_CHARS.get(font, {}).get(int(match[1]))
+            if text:
+                char["text"] = text
+
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=".tmp", dir=os.path.dirname(path))
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, path)
+
+
+def _read_json(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def file_hash(path):
+    """Return the SHA-256 of ``path``, reusing the stored hash if it is unchanged."""
+    st = os.stat(path)
+    key = os.path.abspath(path)
+    index = _read_json(HASH_INDEX) or {}
+    entry = index.get(key)
+    if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+        return entry["sha256"]
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        digest = hashlib.sha256(mm).hexdigest()
+    # Re-read before writing: other workers may have added entries meanwhile.
+    index = _read_json(HASH_INDEX) or {}
+    index[key] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+    _write_json(HASH_INDEX, index)
+    return digest
+
+
+class Document:
+    """Lazily extracted, cached pages of one PDF."""
+
+    def __init__(self, path, cache_dir=None):
+        self.path = path
+        self.dir = os.path.join(cache_dir or CACHE_DIR, f"{file_hash(path)}-v{CACHE_VERSION}")
+        self._pdf = self._file = self._mm = None
+        meta = _read_json(os.path.join(self.dir, "meta.json"))
+        self.page_count = meta["pages"] if meta else None
+        if self.page_count is None:
+            self.page_count = len(self._open().pages)
+            _write_json(os.path.join(self.dir, "meta.json"), {"pages": self.page_count})
+
+    def _open(self):
+        if self._pdf is None:
+            import pdfplumber
+
+            self._file = open(self.path, "rb")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._pdf = pdfplumber.open(self._mm)
+        return self._pdf
+
+    def close(self):
+        if self._pdf is not None:
+            self._pdf.close()
+            self._mm.close()
+            self._file.close()
+            self._pdf = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def page(self, number):
+        """Return ``{"text", "tables"}`` for 1-based page ``number``."""
+        if not 1 <= number <= self.page_count:
+            raise IndexError(f"{self.path} has {self.page_count} pages; page {number} "
+                             "does not exist")
+        cache_path = os.path.join(self.dir, f"{number:05d}.json")
+        cached = _read_json(cache_path)
+        if cached is not None:
+            return cached
+        page = self._open().pages[number - 1]
+        _fix_cids(page)
+        data = {"text": page.extract_text() or "", "tables": page.extract_tables()}
+        page.close()  # drop pdfplumber's per-page object caches
+        _write_json(cache_path, data)
+        return data
+
+    def pages(self, numbers=None):
+        """Yield ``(number, page)`` for ``numbers`` (default: every page), in order."""
+        for number in range(1, self.page_count + 1) if numbers is None else numbers:
+            yield number, self.page(number)
+
+
+def parse_pages(spec):
+    """Parse ``"1,3-5"`` into ``[1, 3, 4, 5]``."""
+    numbers = []
+    for part in spec.split(","):
+        start, _, end = part.strip().partition("-")
+        try:
+            first, last = int(start), int(end or start)
+        except ValueError:
+            raise ValueError(f"invalid page range {part.strip()!r}; use e.g. 3 or 1,4-6") from None
+        if first > last:
+            raise ValueError(f"page range {part.strip()!r} is reversed; use {last}-{first}")
+        numbers.extend(range(first, last + 1))
+    return numbers
+
+
+def _cell(value):
+    return (value or "").replace("\n", " ").replace("|", "\\|").strip()
+
+
+def page_markdown(number, page):
+    lines = [f"<!-- page {number} -->", "", page["text"].strip()]
+    for table in page["tables"]:
+        if not table:
+            continue
+        width = max(len(row) for row in table)
+        rows = [[_cell(c) for c in row] + [""] * (width - len(row)) for row in table]
+        lines += ["", "| " + " | ".join(rows[0]) + " |", "|" + "---|" * width]
+        lines += ["| " + " | ".join(row) + " |" for row in rows[1:]]
+    return "\n".join(lines) + "\n"
+
+
+def convert_file(path, out, numbers=None, grep=None):
+    """Write pages of ``path`` as markdown to the text stream ``out``, one at a time.
+
+    Returns the number of pages written.
+    """
+    pattern = re.compile(re.escape(grep), re.I) if grep else None
+    written = 0
+    with Document(path) as doc:
+        for number, page in doc.pages(numbers):
+            if pattern and not pattern.search(page["text"]):
+                continue
+            out.write(("\n" if written else "") + page_markdown(number, page))
+            written += 1
+    return written
+
+
+def _convert_job(args):
+    path, out_path = args
+    start = time.perf_counter()
+    try:
+        os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as out:
+            convert_file(path, out)
+    except Exception as exc:  # report and carry on with the other PDFs
+        if os.path.exists(out_path):
+            os.remove(out_path)
+        return path, time.perf_counter() - start, str(exc) or type(exc).__name__
+    return path, time.perf_counter() - start, None
+
+
+def convert_dir(directory, out_dir, workers=None):
+    """Convert every PDF under ``directory`` in parallel.
+
+    Yields ``(path, seconds, error)`` per PDF; ``error`` is None on success.
+    """
+    jobs = []
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            if name.lower().endswith(".pdf"):
+                src = os.path.join(root, name)
+                rel = os.path.splitext(os.path.relpath(src, directory))[0] + ".md"
+                jobs.append((src, os.path.join(out_dir, rel)))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_convert_job, jobs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("source", help="a PDF file or a directory of PDFs")
+    parser.add_argument("--pages", help="pages to convert, e.g. 3 or 1,4-6")
+    parser.add_argument("--grep", help="only pages whose text contains this (case-insensitive)")
+    parser.add_argument("-o", "--output", help="write markdown here instead of stdout")
+    parser.add_argument("--out-dir", help="output folder for directory mode (default: source)")
+    parser.add_argument("--workers", type=int, help="processes for directory mode")
+    args = parser.parse_args(argv)
+
+    try:
+        import pdfplumber  # noqa: F401
+    except ImportError:
+        print("error: pdfplumber is not installed; run with 'uv run scripts/convert.py' "
+              "or 'pip install pdfplumber'", file=sys.stderr)
+        return 2
+
+    try:
+        if os.path.isdir(args.source):
+            done = failed = 0
+            for path, seconds, error in convert_dir(args.source, args.out_dir or args.source,
+                                                    args.workers):
+                if error:
+                    failed += 1
+                    print(f"error: {path}: {error}", file=sys.stderr)
+                else:
+                    done += 1
+                    print(f"{path}: {seconds:.2f} s", file=sys.stderr)
+            print(f"converted {done} PDF(s), {failed} failed", file=sys.stderr)
+            return 1 if failed else 0
+        numbers = parse_pages(args.pages) if args.pages else None
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as out:
+                written = convert_file(args.source, out, numbers, args.grep)
+        else:
+            written = convert_file(args.source, sys.stdout, numbers, args.grep)
+        if args.grep and not written:
+            print(f"no pages contain {args.grep!r}", file=sys.stderr)
+    except (OSError, IndexError, ValueError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
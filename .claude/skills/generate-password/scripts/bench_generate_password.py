@@ -0,0 +1,48 @@
+"""Passwords/s in one streaming call versus one process per password.
+
+Usage:
+    python scripts/bench_generate_password.py
+    python scripts/bench_generate_password.py --count 5000000 --launches 50
+"""
+
+import argparse
+import io
+import os
+import subprocess
+import sys
+import time
+
+from generate_password import PasswordGenerator, write_passwords
+
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generate_password.py")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--launches", type=int, default=20,
+                        help="per-process launches to time (default: 20)")
+    parser.add_argument("--length", type=int, default=16)
+    args = parser.parse_args()
+
+    classes = ["lowercase", "uppercase", "digits", "special"]
+    out = io.BytesIO()
+    start = time.perf_counter()
+    write_passwords(PasswordGenerator(args.length, classes), args.count, out)
+    streamed = args.count / (time.perf_counter() - start)
+    assert out.getvalue().count(b"\n") == args.count
+
+    start = time.perf_counter()
+    for _ in range(args.launches):
+        subprocess.run([sys.executable, SCRIPT, "--length", str(args.length), "--special"],
+                       check=True, stdout=subprocess.DEVNULL)
+    per_process = args.launches / (time.perf_counter() - start)
+
+    print(f"length {args.length}, all four classes")
+    print(f"  streaming --count {args.count:,}: {streamed:12,.0f} passwords/s")
+    print(f"  one process per password:    {per_process:12,.1f} passwords/s")
+    print(f"  speedup:                     {streamed / per_process:12,.0f}x")
+
+
+if __name__ == "__main__":
+    main()
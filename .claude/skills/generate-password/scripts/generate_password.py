@@ -0,0 +1,128 @@
+"""Generate strong random passwords, one or millions per call.
+
+Usage:
+    python scripts/generate_password.py --length 16 --special
+    python scripts/generate_password.py --length 20 --count 7
+    python scripts/generate_password.py --count 1000000 --output passwords.txt
+
+Characters come from the OS random source (``os.urandom``), read in large
+buffers and mapped to the alphabet by rejection sampling, so every character
+is equally likely (no modulo bias). Every password contains at least one
+character from each selected class; passwords that miss a class are thrown
+away and redrawn, which keeps the result uniform over all valid passwords.
+Output is streamed in batches, so memory stays flat for any ``--count``.
+"""
+
+import argparse
+import os
+import string
+import sys
+
+CLASSES = {
+    "lowercase": string.ascii_lowercase,
+    "uppercase": string.ascii_uppercase,
+    "digits": string.digits,
+    "special": "!@#$%^&*()-_=+[]{};:,.<>?/~",
+}
+MIN_LENGTH = 4
+BUFFER_BYTES = 1 << 16
+
+
+class PasswordGenerator:
+    """Streams unbiased passwords over a fixed set of character classes."""
+
+    def __init__(self, length, classes, buffer_bytes=BUFFER_BYTES):
+        if length < len(classes):
+            raise ValueError(f"length {length} is too short to include all "
+                             f"{len(classes)} character classes")
+        self.length = length
+        self.buffer_bytes = buffer_bytes
+        self.classes = [CLASSES[c].encode("ascii") for c in classes]
+        alphabet = b"".join(self.classes)
+        # Bytes >= limit would favour the first (256 % n) characters; drop them.
+        limit = 256 - 256 % len(alphabet)
+        self.table = bytes(alphabet[b % len(alphabet)] if b < limit else 0 for b in range(256))
+        self.rejected = bytes(range(limit, 256))
+
+    def _chars(self):
+        """Yield buffers of uniformly distributed alphabet characters."""
+        while True:
+            yield os.urandom(self.buffer_bytes).translate(self.table, self.rejected)
+
+    def batches(self, count):
+        """Yield lists of passwords (as bytes) until ``count`` have been produced."""
+        length, classes = self.length, self.classes
+        carry = b""
+        for chars in self._chars():
+            if count <= 0:
+                return
+            chars = carry + chars
+            usable = len(chars) - len(chars) % length
+            carry = chars[usable:]
+            batch = []
+            for i in range(0, usable, length):
+                pw = chars[i:i + length]
+                # translate() deletes a class; a shorter result means it was present.
+                if all(len(pw.translate(None, c)) < length for c in classes):
+                    batch.append(pw)
+                    if len(batch) == count:
+                        break
+            count -= len(batch)
+            yield batch
+
+    def generate(self):
+        """Return one password as a string."""
+        # Early batches are empty when a buffer holds no complete password.
+        return next(pw for batch in self.batches(1) for pw in batch).decode("ascii")
+
+
+def write_passwords(generator, count, out):
+    """Write ``count`` newline-separated passwords to the binary stream ``out``."""
+    for batch in generator.batches(count):
+        if batch:
+            out.write(b"\n".join(batch) + b"\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--length", type=int, default=16, help="characters per password (default: 16)")
+    parser.add_argument("--special", action="store_true", help=f"include symbols {CLASSES['special']}")
+    parser.add_argument("--no-uppercase", action="store_true", help="leave out A-Z")
+    parser.add_argument("--no-lowercase", action="store_true", help="leave out a-z")
+    parser.add_argument("--no-digits", action="store_true", help="leave out 0-9")
+    parser.add_argument("--count", type=int, default=1, help="how many passwords (default: 1)")
+    parser.add_argument("-o", "--output", help="write to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    classes = [name for name, off in (("lowercase", args.no_lowercase),
+                                      ("uppercase", args.no_uppercase),
+                                      ("digits", args.no_digits),
+                                      ("special", not args.special)) if not off]
+    if not classes:
+        parser.error("no character classes left; drop a --no-* flag or add --special")
+    if args.length < MIN_LENGTH:
+        parser.error(f"--length must be at least {MIN_LENGTH}; 16 or more is recommended")
+    if args.count < 1:
+        parser.error("--count must be at least 1")
+    try:
+        generator = PasswordGenerator(args.length, classes)
+    except ValueError as exc:
+        parser.error(f"{exc}; increase --length")
+
+    if args.output:
+        fd = os.open(args.output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, "wb", buffering=1 << 20) as out:
+            write_passwords(generator, args.count, out)
+    else:
+        try:
+            write_passwords(generator, args.count, sys.stdout.buffer)
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader stopped early (e.g. "| head"); silence the flush at exit.
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, sys.stdout.fileno())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["pillow"]
+# ///
+"""Batch resize throughput (images/s) and peak memory on generated fixtures.
+
+Usage:
+    uv run scripts/bench_resize.py                        # 200 images, 3 widths
+    uv run scripts/bench_resize.py --images 1000 --workers 1 4 8
+"""
+
+import argparse
+import os
+import resource
+import shutil
+import tempfile
+import time
+
+from resize import resize_all
+
+
+def make_fixtures(root, count, size):
+    from PIL import Image
+
+    w, h = size
+    base = Image.radial_gradient("L").resize((w, h)).convert("RGB")
+    noise = Image.effect_noise((w, h), 40).convert("RGB")
+    for i in range(count):
+        img = Image.blend(base, noise, (i % 10) / 20)
+        ext = ".jpg" if i % 2 else ".png"
+        sub = os.path.join(root, f"set-{i % 10}")
+        os.makedirs(sub, exist_ok=True)
+        img.save(os.path.join(sub, f"img-{i:05d}{ext}"), quality=90)
+
+
+def peak_rss_mb():
+    """Return peak RSS in MB of this process and of the largest finished worker."""
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    child = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    return own / 1024, child / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--images", type=int, default=200)
+    parser.add_argument("--size", type=int, nargs=2, default=[2400, 1436],
+                        help="fixture size (default: the repo's image.png, 2400x1436)")
+    parser.add_argument("--width", type=int, nargs="+", default=[1200, 800, 320])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="resize-bench-")
+    try:
+        src = os.path.join(root, "src")
+        make_fixtures(src, args.images, args.size)
+        for workers in args.workers:
+            out = os.path.join(root, f"out-{workers}")
+            start = time.perf_counter()
+            stats = resize_all([src], args.width, out, workers=workers)
+            elapsed = time.perf_counter() - start
+            assert stats["done"] == args.images, stats
+            start = time.perf_counter()
+            again = resize_all([src], args.width, out, workers=workers)
+            noop = time.perf_counter() - start
+            assert again["skipped"] == args.images, again
+            parent, child = peak_rss_mb()
+            print(f"workers={workers:2d}: {args.images / elapsed:7.1f} images/s "
+                  f"({len(args.width)} sizes each), up-to-date pass {noop * 1000:.0f} ms, "
+                  f"peak RSS parent {parent:.0f} MB / worker {child:.0f} MB")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
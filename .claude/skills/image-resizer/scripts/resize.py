@@ -0,0 +1,278 @@
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["pillow"]
+# ///
+"""Resize images to one or more widths, one file or thousands at a time.
+
+Usage:
+    uv run scripts/resize.py image.png --width 800
+    uv run scripts/resize.py photos/ "assets/**/*.jpg" --width 1600 800 320 --out resized/
+    uv run scripts/resize.py photos/ --width 800 --format webp --quality 80 --workers 8
+
+Each source is decoded once (JPEGs at a reduced size when the largest target
+allows it) and written at every requested width as
+``<out>/<relative path>-<width>w.<ext>``. Aspect ratio is kept and images are
+never upscaled. Sources whose outputs are already up to date are skipped,
+tracked in ``<out>/.resize-manifest.json`` by mtime and size (and by content
+hash with ``--hash``, which survives checkouts that touch mtimes).
+
+Work runs in a process pool with at most two images per worker queued at any
+time, and workers are recycled periodically, so memory stays flat however many
+files are given.
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tif", ".tiff"}
+FORMAT_EXTENSIONS = {"jpeg": ".jpg", "png": ".png", "webp": ".webp"}
+MANIFEST_NAME = ".resize-manifest.json"
+TASKS_PER_CHILD = 200
+ORIENTATION_TAG = 0x0112
+
+
+def find_images(inputs, exclude=None):
+    """Yield ``(path, relative_path)`` for every image file, dir or glob in ``inputs``.
+
+    Anything under the directory ``exclude`` (the output folder) is skipped,
+    so earlier outputs are never resized again.
+    """
+    exclude = os.path.realpath(exclude) if exclude else None
+    seen = set()
+    for pattern in inputs:
+        if os.path.isdir(pattern):
+            base = pattern
+            matches = _walk(pattern, exclude)
+        elif os.path.isfile(pattern):
+            base = os.path.dirname(pattern)
+            matches = [pattern]
+        else:
+            base = _glob_base(pattern)
+            matches = glob.iglob(pattern, recursive=True)
+        for path in matches:
+            if os.path.splitext(path)[1].lower() not in IMAGE_EXTENSIONS:
+                continue
+            if os.path.basename(path) == MANIFEST_NAME:
+                continue
+            real = os.path.realpath(path)
+            if real in seen or _inside(real, exclude) or not os.path.isfile(path):
+                continue
+            seen.add(real)
+            yield path, os.path.relpath(path, base or ".")
+
+
+def _inside(real, directory):
+    return directory is not None and (real == directory
+                                      or real.startswith(directory.rstrip(os.sep) + os.sep))
+
+
+def _walk(top, exclude):
+    for d, dirnames, files in os.walk(top):
+        # Prune in place so os.walk never descends into the output folder.
+        dirnames[:] = [n for n in dirnames
+                       if not _inside(os.path.realpath(os.path.join(d, n)), exclude)]
+        for f in files:
+            yield os.path.join(d, f)
+
+
+def _glob_base(pattern):
+    parts = []
+    for part in pattern.split(os.sep):
+        if glob.has_magic(part):
+            break
+        parts.append(part)
+    return os.sep.join(parts)
+
+
+def output_paths(rel, widths, out_dir, fmt):
+    stem, ext = os.path.splitext(rel)
+    ext = FORMAT_EXTENSIONS[fmt] if fmt else ext.lower()
+    return [os.path.join(out_dir, f"{stem}-{w}w{ext}") for w in widths]
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def resize_one(src, outputs, widths, fmt, quality):
+    """Decode ``src`` once and write it at every width. Runs in a worker."""
+    from PIL import Image, ImageOps
+
+    with Image.open(src) as im:
+        target = max(widths)
+        if im.format == "JPEG":
+            # Let libjpeg decode at 1/2, 1/4 or 1/8 scale, never below target.
+            # EXIF orientations 5-8 rotate by 90 degrees, so the stored height
+            # becomes the displayed width.
+            w, h = im.size
+            if im.getexif().get(ORIENTATION_TAG, 1) in (5, 6, 7, 8):
+                if h > target:
+                    im.draft(None, (round(w * target / h), target))
+            elif w > target:
+                im.draft(None, (target, round(h * target / w)))
+        save_format = (fmt or im.format or "png").upper()
+        im = ImageOps.exif_transpose(im)
+        if save_format == "JPEG" and im.mode not in ("RGB", "L"):
+            im = im.convert("RGB")
+        current = im
+        for width, out in sorted(zip(widths, outputs), reverse=True):
+            if current.width > width:
+                height = max(1, round(current.height * width / current.width))
+                current = current.resize((width, height), Image.LANCZOS, reducing_gap=3.0)
+            os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+            options = {}
+            if save_format in ("JPEG", "WEBP"):
+                options["quality"] = quality
+            if save_format == "JPEG":
+                options["optimize"] = True
+            tmp = f"{out}.tmp{os.getpid()}"
+            current.save(tmp, format=save_format, **options)
+            os.replace(tmp, out)
+    return src
+
+
+class Manifest:
+    """Source stamps for the outputs already written to one output directory."""
+
+    def __init__(self, out_dir):
+        self.path = os.path.join(out_dir, MANIFEST_NAME)
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def up_to_date(self, rel, src, outputs, settings, use_hash):
+        """Return True if ``src`` is unchanged since its outputs were written."""
+        entry = self.entries.get(rel)
+        if not entry or entry["settings"] != settings:
+            return False
+        if not all(os.path.exists(o) for o in outputs):
+            return False
+        st = os.stat(src)
+        if entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            return True
+        if use_hash and entry.get("sha256") and entry["size"] == st.st_size:
+            if file_hash(src) == entry["sha256"]:
+                entry["mtime_ns"] = st.st_mtime_ns
+                return True
+        return False
+
+    def record(self, rel, src, settings, use_hash):
+        st = os.stat(src)
+        self.entries[rel] = {
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "sha256": file_hash(src) if use_hash else None,
+            "settings": settings,
+        }
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=MANIFEST_NAME, dir=os.path.dirname(self.path))
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
+
+
+def resize_all(inputs, widths, out_dir, fmt=None, quality=85, workers=None,
+               use_hash=False, force=False):
+    """Resize every image in ``inputs``; return ``{"done", "skipped", "failed"}`` counts."""
+    widths = sorted(set(widths), reverse=True)
+    settings = {"widths": widths, "format": fmt, "quality": quality}
+    manifest = Manifest(out_dir)
+    workers = workers or os.cpu_count() or 1
+    stats = {"done": 0, "skipped": 0, "failed": 0}
+    pending = {}
+    claimed = {}  # first output path -> source that writes it
+
+    def collect(done):
+        for future in done:
+            rel, src = pending.pop(future)
+            try:
+                future.result()
+            except Exception as exc:
+                stats["failed"] += 1
+                print(f"error: {src}: {exc}", file=sys.stderr)
+            else:
+                stats["done"] += 1
+                manifest.record(rel, src, settings, use_hash)
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             max_tasks_per_child=TASKS_PER_CHILD) as pool:
+        try:
+            for src, rel in find_images(inputs, exclude=out_dir):
+                outputs = output_paths(rel, widths, out_dir, fmt)
+                # e.g. a/logo.png and b/logo.png from two inputs both map to logo-*w.png
+                other = claimed.setdefault(os.path.normcase(outputs[0]), src)
+                if other != src:
+                    stats["failed"] += 1
+                    print(f"error: {src}: would overwrite the outputs of {other}; "
+                          "resize these inputs in separate runs or to separate --out "
+                          "folders", file=sys.stderr)
+                    continue
+                if not force and manifest.up_to_date(rel, src, outputs, settings, use_hash):
+                    stats["skipped"] += 1
+                    continue
+                # Bound the queue so only ~2 images per worker exist at once.
+                while len(pending) >= workers * 2:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                future = pool.submit(resize_one, src, outputs, widths, fmt, quality)
+                pending[future] = (rel, src)
+            collect(wait(pending)[0])
+        finally:
+            manifest.save()
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("inputs", nargs="+", help="image files, directories or globs")
+    parser.add_argument("--width", type=int, nargs="+", required=True,
+                        help="one or more target widths in pixels")
+    parser.add_argument("--out", default="resized", help="output directory (default: resized)")
+    parser.add_argument("--format", choices=sorted(FORMAT_EXTENSIONS),
+                        help="output format (default: same as source)")
+    parser.add_argument("--quality", type=int, default=85, help="JPEG/WebP quality (default: 85)")
+    parser.add_argument("--workers", type=int, help="processes (default: CPU count)")
+    parser.add_argument("--hash", action="store_true",
+                        help="also compare content hashes when mtimes differ")
+    parser.add_argument("--force", action="store_true", help="rewrite up-to-date outputs")
+    args = parser.parse_args(argv)
+
+    if any(w <= 0 for w in args.width):
+        parser.error("--width values must be positive")
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        print("error: Pillow is not installed; run with 'uv run scripts/resize.py' "
+              "or 'pip install pillow'", file=sys.stderr)
+        return 2
+
+    start = time.perf_counter()
+    stats = resize_all(args.inputs, args.width, args.out, args.format, args.quality,
+                       args.workers, args.hash, args.force)
+    elapsed = time.perf_counter() - start
+    total = stats["done"] + stats["skipped"] + stats["failed"]
+    if not total:
+        print(f"error: no images found in {' '.join(args.inputs)}", file=sys.stderr)
+        return 2
+    print(f"{stats['done']} resized, {stats['skipped']} up to date, {stats['failed']} failed "
+          f"in {elapsed:.1f} s -> {args.out}")
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+"""Check templates against the rendered letters in the repo, then time a merge.
+
+The golden check renders each asset template with the values of an existing
+single-render artifact (e.g. party-invite-erik.md) and requires byte-for-byte
+equality. The benchmark streams generated recipients through the invite
+template to a file and to one file per record.
+
+Usage:
+    python scripts/bench_merge.py                   # 100,000 records
+    python scripts/bench_merge.py --records 1000000 --golden-dir path/to/artifacts
+"""
+
+import argparse
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from merge import merge
+from template import Template, load
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ASSETS = os.path.join(HERE, "..", "assets")
+REPO_ROOT = os.path.normpath(os.path.join(HERE, "..", "..", "..", ".."))
+
+INVITE = {
+    "name": "Erik",
+    "when": "Halloween (October 31st) at 8pm",
+    "location": "Worcester City Hall",
+    "dress_code": "Costume - it's Halloween\\!",
+    "host": "Your Host",
+}
+MEMO = {"to": "Human Resources", "sender": "Engineering Team", "date": "January 18, 2026"}
+GOLDEN = [
+    ("party-invite.md", INVITE, "party-invite-erik.md"),
+    ("hr-letter-plain.md", MEMO, "hr-letter.md"),
+    ("hr-letter-ogilvy.md", MEMO, "ogilvy-hr-letter.md"),
+    ("hr-letter-sugarman.md", MEMO, "sugarman-hr-letter.md"),
+    ("hr-letter-halbert.md", {"greeting": "Friend in HR"}, "halbert-hr-letter.md"),
+]
+
+
+def check_golden(golden_dir):
+    ok = True
+    for template, record, expected in GOLDEN:
+        path = os.path.join(golden_dir, expected)
+        if not os.path.exists(path):
+            print(f"  skip {expected}: not found in {golden_dir}")
+            continue
+        with open(path, encoding="utf-8", newline="") as f:
+            want = f.read()
+        got = load(os.path.join(ASSETS, template)).render(record)
+        status = "ok" if got == want else "MISMATCH"
+        ok &= got == want
+        print(f"  {status:8s} {template} -> {expected}")
+    return ok
+
+
+def records(n):
+    for i in range(n):
+        yield {**INVITE, "name": f"Guest {i}"}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--files", type=int, default=10_000,
+                        help="records for the one-file-per-record run")
+    parser.add_argument("--golden-dir", default=REPO_ROOT)
+    args = parser.parse_args()
+
+    print("golden renders:")
+    if not check_golden(args.golden_dir):
+        sys.exit(1)
+
+    template = load(os.path.join(ASSETS, "party-invite.md"))
+    start = time.perf_counter()
+    merge(template, records(args.records), out=io.StringIO())
+    in_memory = args.records / (time.perf_counter() - start)
+
+    tmp = tempfile.mkdtemp(prefix="merge-bench-")
+    try:
+        start = time.perf_counter()
+        with open(os.path.join(tmp, "all.md"), "w", encoding="utf-8",
+                  buffering=1 << 20) as out:
+            merge(template, records(args.records), out=out)
+        one_file = args.records / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        merge(template, records(args.files), out_dir=tmp,
+              filename=Template("party-invite-{{ name }}.md"))
+        per_file = args.files / (time.perf_counter() - start)
+    finally:
+        shutil.rmtree(tmp)
+
+    print(f"render only:        {in_memory:12,.0f} records/s")
+    print(f"stream to one file: {one_file:12,.0f} records/s")
+    print(f"one file each:      {per_file:12,.0f} records/s")
+
+
+if __name__ == "__main__":
+    main()
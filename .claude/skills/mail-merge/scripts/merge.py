@@ -0,0 +1,147 @@
+"""Render a template once, or once per recipient from a CSV/JSONL file.
+
+Usage:
+    python scripts/merge.py assets/party-invite.md --set name=Erik --set host="Your Host" ...
+    python scripts/merge.py assets/party-invite.md guests.csv --out-dir invites/ \\
+        --filename "party-invite-{{ name }}.md"
+    python scripts/merge.py assets/hr-letter-ogilvy.md managers.jsonl -o letters.md
+
+Recipients are read, rendered and written one at a time, so memory stays
+flat for any number of records. ``--set`` values apply to every record and
+are overridden by the record's own fields. Values used in ``--filename`` are
+turned into lowercase, hyphenated slugs.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+import time
+
+from template import Template, TemplateError, load
+
+DEFAULT_SEPARATOR = "\n---\n\n"
+
+
+def read_records(path, fmt=None):
+    """Yield one dict per recipient from a CSV or JSONL file (``-`` for stdin)."""
+    fmt = fmt or ("csv" if path.lower().endswith(".csv") else "jsonl")
+    # utf-8-sig drops the byte order mark that Excel puts on exported CSVs.
+    f = sys.stdin if path == "-" else open(path, encoding="utf-8-sig", newline="")
+    try:
+        if fmt == "csv":
+            for row in csv.DictReader(f):
+                # Short rows fill missing cells with None; treat them as absent
+                # so --set defaults apply and templates report the missing field.
+                yield {k: v for k, v in row.items() if k is not None and v is not None}
+        else:
+            for lineno, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        record = json.loads(line)
+                    except ValueError as exc:
+                        raise TemplateError(f"{path}:{lineno}: invalid JSON ({exc})") from None
+                    if not isinstance(record, dict):
+                        raise TemplateError(f"{path}:{lineno}: expected a JSON object, got "
+                                            f"{json.dumps(record)[:40]}")
+                    yield record
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def slugify(value):
+    return re.sub(r"[^a-z0-9]+", "-", str(value).lower()).strip("-") or "untitled"
+
+
+def merge(template, records, defaults=None, out=None, out_dir=None, filename=None,
+          separator=DEFAULT_SEPARATOR):
+    """Render every record; write to the text stream ``out`` or one file each in ``out_dir``.
+
+    File names that repeat within a run get a ``-2``, ``-3``, ... suffix so no
+    record overwrites another. Returns the number of records rendered.
+    """
+    defaults = defaults or {}
+    count = 0
+    names = set()
+    for count, record in enumerate(records, 1):
+        if defaults:
+            record = {**defaults, **record}
+        try:
+            text = template.render(record)
+        except TemplateError as exc:
+            raise TemplateError(f"record {count}: {exc}") from None
+        if out_dir is not None:
+            missing = [k for k in filename.fields if k not in record]
+            if missing:
+                raise TemplateError(f"record {count}: --filename uses {missing[0]!r}, which "
+                                    "the record does not have; pick --filename fields from "
+                                    "the record or pass --set")
+            name = filename.render({k: slugify(record[k]) for k in filename.fields})
+            stem, ext = os.path.splitext(name)
+            n = 1
+            while name in names:
+                n += 1
+                name = f"{stem}-{n}{ext}"
+            names.add(name)
+            path = os.path.join(out_dir, name)
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+        else:
+            if count > 1:
+                out.write(separator)
+            out.write(text)
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("template", help="template file, e.g. assets/party-invite.md")
+    parser.add_argument("records", nargs="?", help="recipients .csv or .jsonl (- for stdin)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="recipient file format")
+    parser.add_argument("--set", action="append", default=[], metavar="FIELD=VALUE",
+                        help="value for every record (repeatable)")
+    parser.add_argument("-o", "--output", help="write all renders to one file")
+    parser.add_argument("--out-dir", help="write one file per record here")
+    parser.add_argument("--filename", default="{{ name }}.md",
+                        help="file name template for --out-dir (default: %(default)s)")
+    parser.add_argument("--separator", default=DEFAULT_SEPARATOR,
+                        help="text between records in one output (default: a --- rule)")
+    args = parser.parse_args(argv)
+
+    defaults = {}
+    for item in args.set:
+        field, sep, value = item.partition("=")
+        if not sep:
+            parser.error(f"--set {item!r} must look like FIELD=VALUE")
+        defaults[field] = value
+
+    start = time.perf_counter()
+    try:
+        template = load(args.template)
+        records = read_records(args.records, args.format) if args.records else [{}]
+        filename = Template(args.filename, name="--filename")
+        if args.out_dir:
+            os.makedirs(args.out_dir, exist_ok=True)
+            count = merge(template, records, defaults, out_dir=args.out_dir, filename=filename)
+        elif args.output:
+            with open(args.output, "w", encoding="utf-8", newline="", buffering=1 << 20) as out:
+                count = merge(template, records, defaults, out=out, separator=args.separator)
+        else:
+            count = merge(template, records, defaults, out=sys.stdout, separator=args.separator)
+    except (OSError, TemplateError) as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        if isinstance(exc, TemplateError) and "no field" in str(exc):
+            print(f"fields used by the template: {', '.join(load(args.template).fields)}; "
+                  "add a column or pass --set FIELD=VALUE", file=sys.stderr)
+        return 1
+    if args.records:
+        elapsed = time.perf_counter() - start
+        print(f"{count} record(s) rendered in {elapsed:.2f} s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
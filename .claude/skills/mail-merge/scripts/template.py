@@ -0,0 +1,66 @@
+"""Tiny compiled template engine for markdown letters and invites.
+
+Templates are plain text with ``{{ field }}`` placeholders (field names are
+letters, digits and underscores). Everything else, including single braces,
+is copied through unchanged. A template is compiled once into a
+``str.format_map`` pattern, so rendering a record is a single C-level call,
+and ``load`` caches compiled templates by path, mtime and size.
+"""
+
+import functools
+import os
+import re
+
+PLACEHOLDER_RE = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*\}\}")
+
+
+class TemplateError(ValueError):
+    """A template is malformed or a record is missing a field."""
+
+
+class Template:
+    """A compiled template. Render with ``template.render(record)``."""
+
+    def __init__(self, source, name="<template>"):
+        self.name = name
+        parts = []
+        fields = []
+        pos = 0
+        for match in PLACEHOLDER_RE.finditer(source):
+            parts.append(_escape(source[pos:match.start()]))
+            parts.append("{" + match[1] + "}")
+            if match[1] not in fields:
+                fields.append(match[1])
+            pos = match.end()
+        parts.append(_escape(source[pos:]))
+        leftover = re.search(r"\{\{.*?\}\}", PLACEHOLDER_RE.sub("", source))
+        if leftover:
+            raise TemplateError(
+                f"{name}: bad placeholder {leftover[0]!r}; use {{{{ field_name }}}} "
+                "with letters, digits and underscores"
+            )
+        self.fields = fields
+        self._format = "".join(parts).format_map
+
+    def render(self, record):
+        """Return the template filled from the mapping ``record``."""
+        try:
+            return self._format(record)
+        except KeyError as exc:
+            raise TemplateError(f"{self.name}: record has no field {exc.args[0]!r}") from None
+
+
+def _escape(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+@functools.lru_cache(maxsize=64)
+def _load(path, mtime_ns, size):
+    with open(path, encoding="utf-8", newline="") as f:
+        return Template(f.read(), name=os.path.basename(path))
+
+
+def load(path):
+    """Return the compiled template at ``path``, recompiling only if it changed."""
+    st = os.stat(path)
+    return _load(os.path.abspath(path), st.st_mtime_ns, st.st_size)
@@ -0,0 +1,74 @@
+"""Cold vs warm level-1 discovery over a generated tree of skills.
+
+Usage:
+    python scripts/bench_skill_index.py            # 1,000 skills
+    python scripts/bench_skill_index.py --skills 5000 --repeat 5
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from skill_index import INDEX_NAME, index_root
+
+BODY = "Step {i}: follow the procedure and report the result.\n" * 200
+
+
+def make_tree(root, count):
+    for i in range(count):
+        name = f"bench-skill-{i:05d}"
+        os.makedirs(os.path.join(root, name))
+        with open(os.path.join(root, name, "SKILL.md"), "w", encoding="utf-8") as f:
+            f.write(
+                f"---\nname: {name}\n"
+                f"description: Benchmark skill {i}. Use when the user asks about topic {i}.\n"
+                f"---\n\n# {name}\n\n{BODY}"
+            )
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--touch", type=int, default=10,
+                        help="SKILL.md files to modify for the incremental run")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="skill-index-bench-")
+    try:
+        make_tree(root, args.skills)
+        cold, warm, incr = [], [], []
+        for _ in range(args.repeat):
+            try:
+                os.remove(os.path.join(root, INDEX_NAME))
+            except FileNotFoundError:
+                pass
+            cold.append(timed(lambda: index_root(root))[0])
+            warm.append(timed(lambda: index_root(root))[0])
+            for i in range(args.touch):
+                path = os.path.join(root, f"bench-skill-{i:05d}", "SKILL.md")
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write("\n")
+            elapsed, (_, stats) = timed(lambda: index_root(root))
+            assert stats["parsed"] == args.touch, stats
+            incr.append(elapsed)
+
+        print(f"{args.skills} skills, best of {args.repeat}")
+        print(f"  cold (no index):        {min(cold) * 1000:8.1f} ms")
+        print(f"  warm (index, no edits): {min(warm) * 1000:8.1f} ms")
+        print(f"  warm ({args.touch} edited):       {min(incr) * 1000:8.1f} ms")
+        print(f"  speedup warm vs cold:   {min(cold) / min(warm):8.1f}x")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
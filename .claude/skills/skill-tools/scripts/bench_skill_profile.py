@@ -0,0 +1,58 @@
+"""Cold vs cached profiling of a generated skills root.
+
+Usage:
+    python scripts/bench_skill_profile.py              # 300 skills
+    python scripts/bench_skill_profile.py --skills 1000
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from skill_profile import CACHE_NAME, profile
+
+BODY = "Follow step {i} of the procedure and check the output carefully.\n" * 300
+
+
+def make_tree(root, count, references):
+    for i in range(count):
+        name = f"bench-skill-{i:05d}"
+        refs = os.path.join(root, name, "references")
+        os.makedirs(refs)
+        links = "\n".join(f"- [ref {r}](references/ref-{r}.md)" for r in range(references))
+        with open(os.path.join(root, name, "SKILL.md"), "w", encoding="utf-8") as f:
+            f.write(f"---\nname: {name}\ndescription: Benchmark skill {i}.\n---\n\n"
+                    f"# {name}\n\n{links}\n\n{BODY}")
+        for r in range(references):
+            with open(os.path.join(refs, f"ref-{r}.md"), "w", encoding="utf-8") as f:
+                f.write(f"# Reference {r} of {name}\n\n{BODY}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=300)
+    parser.add_argument("--references", type=int, default=3)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="skill-profile-bench-")
+    try:
+        make_tree(root, args.skills, args.references)
+        files = args.skills * (1 + args.references)
+        start = time.perf_counter()
+        profile([root])
+        cold = time.perf_counter() - start
+        assert os.path.exists(os.path.join(root, CACHE_NAME))
+        start = time.perf_counter()
+        profile([root])
+        warm = time.perf_counter() - start
+        print(f"{args.skills} skills, {files} files")
+        print(f"  cold (tokenize all): {cold * 1000:8.1f} ms  ({files / cold:,.0f} files/s)")
+        print(f"  cached:              {warm * 1000:8.1f} ms  ({files / warm:,.0f} files/s)")
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
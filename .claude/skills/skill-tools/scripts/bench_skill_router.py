@@ -0,0 +1,60 @@
+"""Routing latency and collision scan over generated skill descriptions.
+
+Usage:
+    python scripts/bench_skill_router.py               # 1,000 skills
+    python scripts/bench_skill_router.py --skills 5000 --prompts 20000
+"""
+
+import argparse
+import random
+import time
+
+from skill_router import Router
+
+VOCAB = (
+    "pdf image resize letter invite password audit accessibility report travel "
+    "packing weather standup agenda email subject spelling tone convert document "
+    "table chart budget invoice calendar meeting slack summary translate review "
+    "security scan deploy release changelog test coverage lint format commit "
+    "branch issue ticket roadmap survey recipe workout journal photo video audio"
+).split()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skills", type=int, default=1000)
+    parser.add_argument("--prompts", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    records = [
+        {"path": f"/bench/skill-{i}", "name": f"skill-{i}",
+         "description": " ".join(rng.sample(VOCAB, 8)) + f" topic{i}. Use when asked about topic{i}."}
+        for i in range(args.skills)
+    ]
+    prompts = [" ".join(rng.sample(VOCAB, 6)) + f" topic{rng.randrange(args.skills)}"
+               for _ in range(args.prompts)]
+
+    start = time.perf_counter()
+    router = Router(records)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for prompt in prompts:
+        router.route(prompt)
+    route = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pairs = router.collisions()
+    scan = time.perf_counter() - start
+
+    print(f"{args.skills} skills, {args.prompts} prompts")
+    print(f"  index build:     {build * 1000:8.1f} ms")
+    print(f"  route:           {route / args.prompts * 1e6:8.1f} us/prompt "
+          f"({args.prompts / route:,.0f} prompts/s)")
+    print(f"  collision scan:  {scan * 1000:8.1f} ms ({len(pairs)} pairs >= 0.5)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Event logging cost and rollup speed over a generated telemetry log.
+
+Usage:
+    python scripts/bench_skill_telemetry.py                 # 1,000,000 events
+    python scripts/bench_skill_telemetry.py --events 5000000
+"""
+
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from skill_telemetry import EventLog, Rollup
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--skills", type=int, default=300)
+    parser.add_argument("--append", type=int, default=10_000,
+                        help="events appended before the incremental rollup")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = [f"skill-{i:04d}" for i in range(args.skills)]
+    weights = [1 / (i + 1) for i in range(args.skills)]  # a few popular skills
+    picks = rng.choices(names, weights, k=args.events + args.append)
+    tmp = tempfile.mkdtemp(prefix="telemetry-bench-")
+    path = os.path.join(tmp, "events.jsonl")
+    try:
+        log = EventLog(path)
+        start = time.perf_counter()
+        for i in range(args.events):
+            log.log(picks[i], "do the thing", 2, 900, rng.lognormvariate(5, 1))
+        log.flush()
+        per_event = (time.perf_counter() - start) / args.events * 1e6
+        size_mb = os.path.getsize(path) / 1e6
+
+        start = time.perf_counter()
+        rollup = Rollup(path)
+        rollup.refresh()
+        cold = time.perf_counter() - start
+
+        for i in range(args.events, args.events + args.append):
+            log.log(picks[i], "do the thing", 2, 900, rng.lognormvariate(5, 1))
+        log.close()
+        start = time.perf_counter()
+        rollup = Rollup(path)
+        read = rollup.refresh()
+        warm = time.perf_counter() - start
+        assert read == args.append, read
+
+        start = time.perf_counter()
+        rollup.top(10)
+        for name in rollup.skills:
+            rollup.percentile(name)
+        rollup.never(names + ["never-used"])
+        query = time.perf_counter() - start
+    finally:
+        shutil.rmtree(tmp)
+
+    print(f"{args.events:,} events ({size_mb:.0f} MB), {args.skills} skills")
+    print(f"  log one event:        {per_event:8.2f} us")
+    print(f"  cold rollup:          {cold:8.2f} s  ({args.events / cold:,.0f} lines/s)")
+    print(f"  rollup after +{args.append:,}: {warm * 1000:8.1f} ms")
+    print(f"  top + p95 + never:    {query * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
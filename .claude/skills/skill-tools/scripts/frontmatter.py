@@ -0,0 +1,99 @@
+"""Read and check SKILL.md frontmatter without loading the whole file.
+
+Only the block between the opening and closing ``---`` lines is read, so
+large SKILL.md bodies cost nothing at level-1 discovery. The parser covers
+the flat ``key: value`` subset the spec uses (quoted strings and ``|`` /
+``>`` block scalars included); nested mappings such as ``metadata:`` are
+skipped.
+"""
+
+import re
+
+NAME_MAX = 64
+DESCRIPTION_MAX = 1024
+NAME_RE = re.compile(r"^[a-z0-9]+(-[a-z0-9]+)*$")
+
+
+class FrontmatterError(ValueError):
+    """SKILL.md has no usable frontmatter block."""
+
+
+def _unquote(value):
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+        inner = value[1:-1]
+        if value[0] == "'":
+            return inner.replace("''", "'")
+        return re.sub(r"\\(.)", lambda m: {"n": "\n", "t": "\t"}.get(m[1], m[1]), inner)
+    return value
+
+
+def parse_frontmatter(lines):
+    """Parse frontmatter lines (without the ``---`` fences) into a dict."""
+    data = {}
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        i += 1
+        if not line.strip() or line.lstrip().startswith("#") or line[0] in " \t":
+            continue
+        key, sep, value = line.partition(":")
+        if not sep:
+            continue
+        key, value = key.strip(), value.strip()
+        if value[:1] in ("|", ">"):
+            block = []
+            while i < len(lines) and (not lines[i].strip() or lines[i][0] in " \t"):
+                block.append(lines[i].strip())
+                i += 1
+            joiner = "\n" if value[0] == "|" else " "
+            data[key] = joiner.join(block).strip()
+        elif value:
+            data[key] = _unquote(value)
+        else:
+            # Nested mapping or list; level-1 discovery does not need it.
+            while i < len(lines) and (not lines[i].strip() or lines[i][0] in " \t-"):
+                i += 1
+    return data
+
+
+def read_frontmatter(path):
+    """Return the frontmatter dict of a SKILL.md, reading only its header."""
+    with open(path, encoding="utf-8") as f:
+        first = f.readline()
+        if first.rstrip("\r\n") != "---":
+            raise FrontmatterError("frontmatter must start with '---' on line 1")
+        lines = []
+        for line in f:
+            line = line.rstrip("\r\n")
+            if line == "---":
+                return parse_frontmatter(lines)
+            lines.append(line)
+    raise FrontmatterError("frontmatter is missing its closing '---'")
+
+
+def check_frontmatter(meta, dirname):
+    """Return a list of human-readable problems with ``meta`` (empty if OK)."""
+    problems = []
+    name = meta.get("name", "")
+    description = meta.get("description", "")
+    if not name:
+        problems.append("name is missing: add 'name: <skill-name>' to the frontmatter")
+    else:
+        if len(name) > NAME_MAX:
+            problems.append(f"name is {len(name)} chars: keep it to {NAME_MAX} or fewer")
+        if not NAME_RE.match(name):
+            problems.append(
+                f"name {name!r} is invalid: use lowercase letters, numbers and "
+                "single hyphens, not starting or ending with a hyphen"
+            )
+        if name != dirname:
+            problems.append(
+                f"name {name!r} does not match directory {dirname!r}: rename one to match"
+            )
+    if not description:
+        problems.append("description is missing: say what the skill does and when to use it")
+    elif len(description) > DESCRIPTION_MAX:
+        problems.append(
+            f"description is {len(description)} chars: trim it to {DESCRIPTION_MAX} or fewer"
+        )
+    return problems
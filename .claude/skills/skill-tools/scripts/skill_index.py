@@ -0,0 +1,147 @@
+"""Level-1 skill discovery backed by a persistent index.
+
+Each skill root (``~/.claude/skills``, ``.claude/skills``) gets one compact
+``.skill-index.json`` file holding the name, description and frontmatter
+problems of every skill, keyed by directory name and stamped with the
+SKILL.md mtime and size. On the next run only SKILL.md files whose stamp
+changed are re-parsed; everything else is served from the index.
+
+Usage:
+    python scripts/skill_index.py                 # default roots
+    python scripts/skill_index.py path/to/skills  # explicit roots
+    python scripts/skill_index.py --json          # machine-readable output
+    python scripts/skill_index.py --rebuild       # ignore existing indexes
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+
+from frontmatter import FrontmatterError, check_frontmatter, read_frontmatter
+
+INDEX_NAME = ".skill-index.json"
+INDEX_VERSION = 1
+DEFAULT_ROOTS = ("~/.claude/skills", ".claude/skills")
+
+
+def _load_index(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != INDEX_VERSION:
+        return {}
+    return data.get("skills", {})
+
+
+def _write_index(path, skills):
+    payload = {"version": INDEX_VERSION, "skills": skills}
+    fd, tmp = tempfile.mkstemp(prefix=INDEX_NAME, dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"), ensure_ascii=False)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _parse_entry(skill_md, dirname, st):
+    entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+    try:
+        meta = read_frontmatter(skill_md)
+    except (FrontmatterError, UnicodeDecodeError) as exc:
+        entry.update(name="", description="", problems=[str(exc)])
+        return entry
+    entry.update(
+        name=meta.get("name", ""),
+        description=meta.get("description", ""),
+        problems=check_frontmatter(meta, dirname),
+    )
+    return entry
+
+
+def index_root(root, rebuild=False):
+    """Return ``(skills, stats)`` for one skill root, refreshing its index.
+
+    ``skills`` maps directory name to its index entry; ``stats`` counts how
+    many entries were reused, re-parsed and dropped.
+    """
+    index_path = os.path.join(root, INDEX_NAME)
+    cached = {} if rebuild else _load_index(index_path)
+    skills = {}
+    stats = {"reused": 0, "parsed": 0, "removed": 0}
+    try:
+        entries = os.scandir(root)
+    except FileNotFoundError:
+        return skills, stats
+    with entries:
+        for entry in entries:
+            if entry.name.startswith(".") or not entry.is_dir():
+                continue
+            skill_md = os.path.join(entry.path, "SKILL.md")
+            try:
+                st = os.stat(skill_md)
+            except FileNotFoundError:
+                continue
+            old = cached.get(entry.name)
+            if old and old["mtime_ns"] == st.st_mtime_ns and old["size"] == st.st_size:
+                skills[entry.name] = old
+                stats["reused"] += 1
+            else:
+                skills[entry.name] = _parse_entry(skill_md, entry.name, st)
+                stats["parsed"] += 1
+    stats["removed"] = len(cached.keys() - skills.keys())
+    if stats["parsed"] or stats["removed"] or (rebuild and skills):
+        try:
+            _write_index(index_path, skills)
+        except OSError as exc:
+            print(f"warning: could not write {index_path}: {exc}", file=sys.stderr)
+    return skills, stats
+
+
+def discover(roots=DEFAULT_ROOTS, rebuild=False):
+    """Return a list of level-1 records for every skill under ``roots``."""
+    records = []
+    for root in roots:
+        root = os.path.expanduser(root)
+        skills, _ = index_root(root, rebuild=rebuild)
+        for dirname in sorted(skills):
+            entry = skills[dirname]
+            records.append({
+                "path": os.path.join(root, dirname),
+                "name": entry["name"],
+                "description": entry["description"],
+                "problems": entry["problems"],
+            })
+    return records
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("roots", nargs="*", default=list(DEFAULT_ROOTS),
+                        help="skill roots to index (default: %(default)s)")
+    parser.add_argument("--json", action="store_true", help="print JSON records")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="re-parse every SKILL.md and rewrite the index")
+    args = parser.parse_args(argv)
+
+    records = discover(args.roots, rebuild=args.rebuild)
+    if args.json:
+        json.dump(records, sys.stdout, indent=2, ensure_ascii=False)
+        sys.stdout.write("\n")
+    else:
+        for rec in records:
+            print(f"{rec['name'] or '?'}: {rec['description']}")
+    failed = [rec for rec in records if rec["problems"]]
+    for rec in failed:
+        for problem in rec["problems"]:
+            print(f"{rec['path']}/SKILL.md: {problem}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
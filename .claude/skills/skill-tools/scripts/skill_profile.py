@@ -0,0 +1,293 @@
+"""Token profiler and budget check for skill folders.
+
+Reports what each loading level of a skill costs:
+
+1. name + description (always in context)
+2. the full SKILL.md (loaded when the skill triggers)
+3. every file under references/, scripts/, assets/ etc. (loaded as needed)
+
+and flags budget breaches: SKILL.md over 500 lines or 5000 tokens, oversized
+references, and reference chains (a -> b -> c) that break the one level deep
+rule. Token counts are estimates (see ``estimate_tokens``) and are cached per
+file content hash in ``<root>/.skill-profile-cache.json``, so repeated runs over
+a whole skills root only tokenize files that changed.
+
+Usage:
+    python scripts/skill_profile.py .claude/skills            # whole root
+    python scripts/skill_profile.py .claude/skills/my-skill   # one skill
+    python scripts/skill_profile.py .claude/skills --json -o report.json
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import posixpath
+import re
+import sys
+import tempfile
+
+from frontmatter import parse_frontmatter
+
+CACHE_NAME = ".skill-profile-cache.json"
+CACHE_VERSION = 1
+
+LEVEL1_MAX_TOKENS = 100
+SKILL_MD_MAX_LINES = 500
+SKILL_MD_MAX_TOKENS = 5000
+REFERENCE_MAX_TOKENS = 2000
+
+TOKEN_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+LINK_RE = re.compile(r"\[[^\]]*\]\(\s*<?([^)\s>]+)>?[^)]*\)")
+PATH_RE = re.compile(r"(?<![\w/.-])((?:references|examples)/[\w./-]+\.\w+)")
+REFERENCE_DIRS = ("references", "examples")
+# Authoring-time files the agent never loads.
+SKIP_DIRS = frozenset({"__pycache__", "evals"})
+
+
+def estimate_tokens(text):
+    """Estimate BPE tokens: one per punctuation mark, ~4 chars per word piece."""
+    return sum((len(m) + 3) // 4 for m in TOKEN_RE.findall(text))
+
+
+class TokenCache:
+    """Token counts keyed by file content hash, persisted per skills root."""
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = {}
+        self.used = set()
+        self.dirty = False
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                self.entries = data["entries"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def measure(self, data):
+        """Return ``{"tokens", "lines", "text"}`` for raw file bytes."""
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        self.used.add(digest)
+        entry = self.entries.get(digest)
+        if entry is not None:
+            return entry
+        text = _decode(data)
+        if text is None:
+            entry = {"tokens": 0, "lines": 0, "text": False}
+        else:
+            entry = {"tokens": estimate_tokens(text),
+                     "lines": text.count("\n") + (not text.endswith("\n") and bool(text)),
+                     "text": True}
+        self.entries[digest] = entry
+        self.dirty = True
+        return entry
+
+    def save(self):
+        """Write back the entries used in this run, dropping stale ones."""
+        if not self.dirty and self.used == self.entries.keys():
+            return
+        self.entries = {d: e for d, e in self.entries.items() if d in self.used}
+        payload = {"version": CACHE_VERSION, "entries": self.entries}
+        fd, tmp = tempfile.mkstemp(prefix=CACHE_NAME, dir=os.path.dirname(self.path))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+
+def _decode(data):
+    if b"\0" in data[:8192]:
+        return None
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+
+
+def _split_skill_md(text):
+    lines = text.splitlines()
+    if not lines or lines[0].strip() != "---":
+        return {}
+    for i, line in enumerate(lines[1:], 1):
+        if line.strip() == "---":
+            return parse_frontmatter(lines[1:i])
+    return {}
+
+
+def _links(text, source, skill_dir):
+    """Yield skill-relative paths of local files linked from ``source``.
+
+    Markdown links from SKILL.md are yielded even when the target is missing
+    so they can be reported; bare ``references/...`` mentions only count when
+    the file exists.
+    """
+    base = posixpath.dirname(source)
+    targets = set(LINK_RE.findall(text))
+    if source == "SKILL.md":
+        targets.update(p for p in PATH_RE.findall(text)
+                       if os.path.isfile(os.path.join(skill_dir, p)))
+    for target in targets:
+        target = target.split("#", 1)[0]
+        if not target or re.match(r"^[a-z][a-z0-9+.-]*:", target) or target.startswith("/"):
+            continue
+        rel = posixpath.normpath(posixpath.join(base, target))
+        if rel.startswith("../"):
+            continue
+        if os.path.isfile(os.path.join(skill_dir, rel)) or source == "SKILL.md":
+            yield rel
+
+
+def profile_skill(skill_dir, cache):
+    """Return the profile dict for one skill folder."""
+    report = {
+        "skill": os.path.basename(os.path.normpath(skill_dir)),
+        "path": skill_dir,
+        "levels": {},
+        "files": [],
+        "problems": [],
+    }
+    problems = report["problems"]
+    skill_md = os.path.join(skill_dir, "SKILL.md")
+    try:
+        with open(skill_md, "rb") as f:
+            raw = f.read()
+    except OSError as exc:
+        problems.append({"severity": "error", "file": "SKILL.md", "message": str(exc)})
+        return report
+
+    text = _decode(raw) or ""
+    meta = _split_skill_md(text)
+    level1 = estimate_tokens(f"{meta.get('name', '')}\n{meta.get('description', '')}")
+    skill = cache.measure(raw)
+    report["levels"]["1"] = {"tokens": level1}
+    report["levels"]["2"] = {"tokens": skill["tokens"], "lines": skill["lines"]}
+    if level1 > LEVEL1_MAX_TOKENS:
+        problems.append({"severity": "warning", "file": "SKILL.md",
+                         "message": f"name + description is ~{level1} tokens; "
+                                    f"aim for {LEVEL1_MAX_TOKENS} or fewer"})
+    if skill["lines"] > SKILL_MD_MAX_LINES:
+        problems.append({"severity": "error", "file": "SKILL.md",
+                         "message": f"{skill['lines']} lines; keep SKILL.md under "
+                                    f"{SKILL_MD_MAX_LINES} and move detail to references/"})
+    if skill["tokens"] > SKILL_MD_MAX_TOKENS:
+        problems.append({"severity": "error", "file": "SKILL.md",
+                         "message": f"~{skill['tokens']} tokens; keep SKILL.md under "
+                                    f"{SKILL_MD_MAX_TOKENS} and move detail to references/"})
+
+    linked = set(_links(text, "SKILL.md", skill_dir))
+    level3 = 0
+    texts = {}
+    for dirpath, dirnames, filenames in os.walk(skill_dir):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS)
+        for filename in sorted(filenames):
+            path = os.path.join(dirpath, filename)
+            rel = os.path.relpath(path, skill_dir).replace(os.sep, "/")
+            if rel == "SKILL.md" or filename.startswith("."):
+                continue
+            try:
+                with open(path, "rb") as f:
+                    data = f.read()
+            except OSError as exc:
+                problems.append({"severity": "error", "file": rel,
+                                 "message": f"cannot read: {exc.strerror or exc}"})
+                continue
+            m = cache.measure(data)
+            report["files"].append({"path": rel, "bytes": len(data),
+                                    "tokens": m["tokens"], "text": m["text"]})
+            level3 += m["tokens"]
+            if rel.split("/", 1)[0] in REFERENCE_DIRS and m["text"]:
+                texts[rel] = data.decode("utf-8")
+                if m["tokens"] > REFERENCE_MAX_TOKENS:
+                    problems.append({"severity": "warning", "file": rel,
+                                     "message": f"~{m['tokens']} tokens; keep references "
+                                                f"under {REFERENCE_MAX_TOKENS} or split them"})
+    report["levels"]["3"] = {"tokens": level3, "files": len(report["files"])}
+
+    for rel in sorted(linked):
+        if not os.path.isfile(os.path.join(skill_dir, rel)):
+            problems.append({"severity": "error", "file": "SKILL.md",
+                             "message": f"links to missing file {rel}"})
+    for rel, body in sorted(texts.items()):
+        for target in sorted(set(_links(body, rel, skill_dir))):
+            if target in texts:
+                problems.append({"severity": "error", "file": rel,
+                                 "message": f"reference chain {rel} -> {target}; link "
+                                            f"{target} directly from SKILL.md instead"})
+        if rel not in linked:
+            problems.append({"severity": "warning", "file": rel,
+                             "message": "not linked from SKILL.md, so the agent cannot find it"})
+    return report
+
+
+def _skill_dirs(path):
+    if os.path.isfile(os.path.join(path, "SKILL.md")):
+        return os.path.dirname(os.path.abspath(path)), [path]
+    dirs = sorted(
+        e.path for e in os.scandir(path)
+        if e.is_dir() and not e.name.startswith(".")
+        and os.path.isfile(os.path.join(e.path, "SKILL.md"))
+    )
+    return path, dirs
+
+
+def profile(paths):
+    """Profile every skill under ``paths`` (skill folders or skill roots)."""
+    reports = []
+    for path in paths:
+        root, dirs = _skill_dirs(path)
+        cache = TokenCache(os.path.join(root, CACHE_NAME))
+        reports.extend(profile_skill(d, cache) for d in dirs)
+        try:
+            cache.save()
+        except OSError as exc:
+            print(f"warning: could not write {cache.path}: {exc}", file=sys.stderr)
+    return reports
+
+
+def _print_text(reports):
+    for r in reports:
+        lv = r["levels"]
+        if "2" not in lv:
+            print(f"{r['skill']}: no SKILL.md")
+        else:
+            print(f"{r['skill']}: L1 ~{lv['1']['tokens']} tok | "
+                  f"L2 ~{lv['2']['tokens']} tok, {lv['2']['lines']} lines | "
+                  f"L3 ~{lv['3']['tokens']} tok in {lv['3']['files']} files")
+        for p in r["problems"]:
+            print(f"  {p['severity']}: {p['file']}: {p['message']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="*", default=[".claude/skills"],
+                        help="skill folders or skill roots (default: .claude/skills)")
+    parser.add_argument("--json", action="store_true", help="emit a JSON report")
+    parser.add_argument("-o", "--output", help="write the report to a file")
+    args = parser.parse_args(argv)
+
+    for path in args.paths:
+        if not os.path.isdir(path):
+            print(f"error: {path} not found", file=sys.stderr)
+            return 2
+    reports = profile(args.paths)
+    if args.json or args.output:
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            json.dump({"skills": reports}, out, indent=2, ensure_ascii=False)
+            out.write("\n")
+        finally:
+            if args.output:
+                out.close()
+    if not args.json:
+        _print_text(reports)
+    errors = any(p["severity"] == "error" for r in reports for p in r["problems"])
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""Local description router: which skills would a prompt trigger?
+
+Descriptions are the only thing an agent matches at level 1, so this builds
+an inverted TF-IDF index over every SKILL.md description (via the cached
+skill index) and scores a prompt against all skills at once by walking only
+the postings of the prompt's terms.
+
+Usage:
+    python scripts/skill_router.py route "resize these photos to 800px"
+    python scripts/skill_router.py collisions --threshold 0.4
+    python scripts/skill_router.py eval --json
+
+``eval`` runs each skill's ``evals/triggers.json``::
+
+    {"should_trigger": ["...", ...], "should_not_trigger": ["...", ...]}
+
+(5 + 5 prompts is the recommended minimum) and reports precision, recall and
+routing throughput per skill and overall.
+"""
+
+import argparse
+import heapq
+import json
+import math
+import os
+import re
+import sys
+import time
+from collections import Counter, defaultdict
+
+from skill_index import DEFAULT_ROOTS, discover
+
+TRIGGERS_FILE = os.path.join("evals", "triggers.json")
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_COLLISION_THRESHOLD = 0.5
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = frozenset(
+    "a an and are as at be by can do for from has have how i in is it its me my "
+    "of on or our so that the their them then this to use used user uses using "
+    "want was we what when which will with you your".split()
+)
+
+
+def terms(text):
+    """Lowercase, drop stopwords and strip common English suffixes."""
+    out = []
+    for word in WORD_RE.findall(text.lower()):
+        if word in STOPWORDS:
+            continue
+        for suffix in ("ing", "ed", "es", "s"):
+            if len(word) > len(suffix) + 3 and word.endswith(suffix):
+                word = word[: -len(suffix)]
+                break
+        out.append(word)
+    return out
+
+
+class Router:
+    """Inverted TF-IDF index over skill descriptions."""
+
+    def __init__(self, records):
+        self.names = [rec["name"] or os.path.basename(rec["path"]) for rec in records]
+        self.paths = [rec["path"] for rec in records]
+        counts = [Counter(terms(rec["description"])) for rec in records]
+        df = Counter(t for c in counts for t in c)
+        n = len(records)
+        self.idf = {t: math.log((1 + n) / (1 + d)) + 1 for t, d in df.items()}
+        self.postings = defaultdict(list)
+        for doc, c in enumerate(counts):
+            weights = {t: (1 + math.log(tf)) * self.idf[t] for t, tf in c.items()}
+            norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+            for t, w in weights.items():
+                self.postings[t].append((doc, w / norm))
+
+    def scores(self, prompt):
+        """Return ``{doc: cosine}`` for every skill sharing a term with ``prompt``."""
+        q = Counter(t for t in terms(prompt) if t in self.idf)
+        qw = {t: (1 + math.log(tf)) * self.idf[t] for t, tf in q.items()}
+        qnorm = math.sqrt(sum(w * w for w in qw.values()))
+        acc = defaultdict(float)
+        if not qnorm:
+            return acc
+        for t, w in qw.items():
+            w /= qnorm
+            for doc, dw in self.postings[t]:
+                acc[doc] += w * dw
+        return acc
+
+    def route(self, prompt, top_k=1, threshold=DEFAULT_THRESHOLD):
+        """Return up to ``top_k`` ``(name, score)`` pairs scoring >= ``threshold``."""
+        ranked = heapq.nlargest(top_k, self.scores(prompt).items(), key=lambda kv: kv[1])
+        return [(self.names[d], s) for d, s in ranked if s >= threshold]
+
+    def collisions(self, threshold=DEFAULT_COLLISION_THRESHOLD):
+        """Return ``(a, b, similarity)`` for description pairs at or above ``threshold``."""
+        dots = defaultdict(float)
+        for plist in self.postings.values():
+            for i, (a, wa) in enumerate(plist):
+                for b, wb in plist[i + 1:]:
+                    dots[a, b] += wa * wb
+        pairs = [(self.names[a], self.names[b], s)
+                 for (a, b), s in dots.items() if s >= threshold]
+        return sorted(pairs, key=lambda p: -p[2])
+
+
+def _load_triggers(path):
+    try:
+        with open(os.path.join(path, TRIGGERS_FILE), encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    return data.get("should_trigger", []), data.get("should_not_trigger", [])
+
+
+def evaluate(router, top_k=1, threshold=DEFAULT_THRESHOLD):
+    """Run every skill's trigger prompts and return the eval report."""
+    skills = []
+    total = Counter()
+    prompts = 0
+    elapsed = 0.0
+    for name, path in zip(router.names, router.paths):
+        sets = _load_triggers(path)
+        if sets is None:
+            continue
+        c = Counter()
+        for expected, batch in zip((True, False), sets):
+            for prompt in batch:
+                start = time.perf_counter()
+                hit = any(n == name for n, _ in router.route(prompt, top_k, threshold))
+                elapsed += time.perf_counter() - start
+                prompts += 1
+                c[("tp" if hit else "fn") if expected else ("fp" if hit else "tn")] += 1
+        total.update(c)
+        skills.append({"skill": name, **_rates(c),
+                       "should_trigger": len(sets[0]), "should_not_trigger": len(sets[1])})
+    return {
+        "skills": skills,
+        "overall": _rates(total),
+        "prompts": prompts,
+        "prompts_per_sec": prompts / elapsed if elapsed else None,
+        "mean_latency_us": elapsed / prompts * 1e6 if prompts else None,
+    }
+
+
+def _rates(c):
+    tp, fp, fn, tn = c["tp"], c["fp"], c["fn"], c["tn"]
+    return {
+        "tp": tp, "fp": fp, "fn": fn, "tn": tn,
+        "precision": tp / (tp + fp) if tp + fp else None,
+        "recall": tp / (tp + fn) if tp + fn else None,
+    }
+
+
+def _fmt(x):
+    return "-" if x is None else f"{x:.2f}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    root_help = f"skill root (repeatable, default: {', '.join(DEFAULT_ROOTS)})"
+    parser.add_argument("--root", action="append", dest="roots", help=root_help)
+    parser.add_argument("--json", action="store_true", help="print JSON output")
+    # Also accept the options after the command; SUPPRESS keeps values given before it.
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--root", action="append", dest="roots", default=argparse.SUPPRESS,
+                        help=root_help)
+    common.add_argument("--json", action="store_true", default=argparse.SUPPRESS,
+                        help="print JSON output")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("route", help="score one prompt against every skill", parents=[common])
+    p.add_argument("prompt")
+    p.add_argument("--top", type=int, default=5)
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    p = sub.add_parser("collisions", help="list descriptions that overlap",
+                       parents=[common])
+    p.add_argument("--threshold", type=float, default=DEFAULT_COLLISION_THRESHOLD)
+    p = sub.add_parser("eval", help="run every skill's evals/triggers.json",
+                       parents=[common])
+    p.add_argument("--top", type=int, default=1,
+                   help="a skill triggers if it ranks in the top N (default: 1)")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    router = Router(discover(args.roots or DEFAULT_ROOTS))
+    if args.command == "route":
+        result = [{"skill": n, "score": s} for n, s in router.route(args.prompt, args.top,
+                                                                     args.threshold)]
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            for r in result:
+                print(f"{r['score']:.3f}  {r['skill']}")
+        return 0
+    if args.command == "collisions":
+        result = [{"a": a, "b": b, "similarity": s}
+                  for a, b, s in router.collisions(args.threshold)]
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            for r in result:
+                print(f"{r['similarity']:.3f}  {r['a']} <-> {r['b']}")
+        return 1 if result else 0
+
+    report = evaluate(router, args.top, args.threshold)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for s in report["skills"]:
+            print(f"{s['skill']}: precision {_fmt(s['precision'])}  recall {_fmt(s['recall'])}"
+                  f"  (tp {s['tp']} fp {s['fp']} fn {s['fn']} tn {s['tn']})")
+        o = report["overall"]
+        print(f"overall: precision {_fmt(o['precision'])}  recall {_fmt(o['recall'])}  "
+              f"{report['prompts']} prompts")
+        if report["prompts"]:
+            print(f"throughput: {report['prompts_per_sec']:,.0f} prompts/s "
+                  f"({report['mean_latency_us']:.1f} us/prompt)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())